@@ -4,7 +4,7 @@ Code for composing all of the convergence functionality together.
 from pyrsistent import freeze, pset
 
 from toolz.dicttoolz import get_in, merge
-from toolz.itertoolz import groupby
+from toolz.functoolz import memoize
 
 from otter.convergence.model import (
     CLBDescription,
@@ -16,6 +16,28 @@ from otter.convergence.model import (
 from otter.util.fp import set_in
 
 
+_SERVER_METADATA_PATH = ('server', 'metadata')
+
+
+class _BoundedCache(dict):
+    """
+    A dict usable as a :func:`memoize` cache that holds at most ``maxsize``
+    entries, forgetting all of them to make room once it is full.
+    """
+    def __init__(self, maxsize):
+        dict.__init__(self)
+        self.maxsize = maxsize
+
+    def __setitem__(self, key, value):
+        """Set ``key``, clearing the cache first if it is full."""
+        if key not in self and len(self) >= self.maxsize:
+            self.clear()
+        dict.__setitem__(self, key, value)
+
+# The last "non-convergence-tenants" config value seen and its frozenset
+_disabled_tenants_cache = {'raw': None, 'frozen': frozenset()}
+
+
 def tenant_is_enabled(tenant_id, get_config_value):
     """
     Feature-flag test: is the given tenant enabled for convergence?
@@ -28,24 +50,55 @@ def tenant_is_enabled(tenant_id, get_config_value):
     if disabled_tenant_ids == 'none':
         return True
     if disabled_tenant_ids is not None:
-        return (tenant_id not in disabled_tenant_ids)
+        return (tenant_id not in _frozen_tenant_ids(disabled_tenant_ids))
     return True
 
 
+def _frozen_tenant_ids(tenant_ids):
+    """
+    Return ``tenant_ids`` as a frozenset. :func:`tenant_is_enabled` is called
+    for every group when filtering all groups, so the frozenset is only
+    rebuilt when the config gives a different list than last time.  A copy
+    of the list is kept, so a list changed in place is noticed too.
+    """
+    if tenant_ids != _disabled_tenants_cache['raw']:
+        _disabled_tenants_cache.update(raw=list(tenant_ids),
+                                       frozen=frozenset(tenant_ids))
+    return _disabled_tenants_cache['frozen']
+
+
 def json_to_LBConfigs(lbs_json):
     """
     Convert load balancer config from JSON to :obj:`CLBDescription`
 
+    Launch configs change far less often than groups are converged, so the
+    result is memoized on the frozen form of ``lbs_json``, keeping at most
+    1024 LB configs. This is safe since the descriptions returned are
+    immutable.
+
     :param lbs_json: Sequence of load balancer configs
     :return: Sequence of :class:`ILBDescription` providers
     """
-    by_type = groupby(lambda lb: lb.get('type', 'CloudLoadBalancer'), lbs_json)
-    return pset(
-        [CLBDescription(lb_id=str(lb['loadBalancerId']), port=lb['port'])
-         for lb in by_type.get('CloudLoadBalancer', [])] +
-        [RCv3Description(lb_id=str(lb['loadBalancerId']))
-         for lb in by_type.get('RackConnectV3', [])]
-    )
+    return _frozen_json_to_LBConfigs(freeze(lbs_json))
+
+
+@memoize(cache=_BoundedCache(1024))
+def _frozen_json_to_LBConfigs(lbs_json):
+    """
+    Memoized implementation of :func:`json_to_LBConfigs`.
+
+    :param lbs_json: Frozen (hashable) sequence of load balancer configs
+    """
+    descriptions = []
+    for lb in lbs_json:
+        lb_type = lb.get('type', 'CloudLoadBalancer')
+        if lb_type == 'CloudLoadBalancer':
+            descriptions.append(CLBDescription(
+                lb_id=str(lb['loadBalancerId']), port=lb['port']))
+        elif lb_type == 'RackConnectV3':
+            descriptions.append(RCv3Description(
+                lb_id=str(lb['loadBalancerId'])))
+    return pset(descriptions)
 
 
 def get_desired_server_group_state(group_id, launch_config, desired):
@@ -57,8 +110,7 @@ def get_desired_server_group_state(group_id, launch_config, desired):
         :obj:`otter.json_schema.group_schemas.launch_config`
     :param int desired: Group's desired capacity
     """
-    lbs = freeze(launch_config['args'].get('loadBalancers', []))
-    lbs = json_to_LBConfigs(lbs)
+    lbs = json_to_LBConfigs(launch_config['args'].get('loadBalancers', []))
     server_lc = prepare_server_launch_config(
         group_id,
         freeze({'server': launch_config['args']['server']}),
@@ -102,10 +154,10 @@ def prepare_server_launch_config(group_id, server_config, lb_descriptions):
         :class:`ILBDescription` providers
     """
     updated_metadata = merge(
-        get_in(('server', 'metadata'), server_config, {}),
+        get_in(_SERVER_METADATA_PATH, server_config, {}),
         generate_metadata(group_id, lb_descriptions))
 
-    return set_in(server_config, ('server', 'metadata'), updated_metadata)
+    return set_in(server_config, _SERVER_METADATA_PATH, updated_metadata)
 
 
 def prepare_stack_launch_config(group_id, stack_config):
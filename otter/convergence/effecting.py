@@ -5,10 +5,11 @@ from effect import parallel
 from otter.convergence.model import ErrorReason, StepResult
 
 
+def _retry_on_error(exc_info):
+    """Treat an unknown error from a step as a RETRY result."""
+    return StepResult.RETRY, [ErrorReason.Exception(exc_info)]
+
+
 def steps_to_effect(steps):
     """Turns a collection of :class:`IStep` providers into an effect."""
-    # Treat unknown errors as RETRY.
-    return parallel([
-        s.as_effect().on(error=lambda e: (StepResult.RETRY,
-                                          [ErrorReason.Exception(e)]))
-        for s in steps])
+    return parallel([s.as_effect().on(error=_retry_on_error) for s in steps])
@@ -144,6 +144,11 @@ def get_scaling_group_servers(tenant_id, group_id, now,
         servers = (yield all_as_servers()).get(group_id, [])
     else:
         current = yield all_servers()
+        # Only this group's servers and the cached ones (which may have left
+        # the group) matter, so don't merge in all of the tenant's servers
+        cached_ids = set(s['id'] for s in cached_servers)
+        current = [s for s in current
+                   if s['id'] in cached_ids or server_of_group(group_id, s)]
         servers = mark_deleted_servers(cached_servers, current)
         servers = list(filter(server_of_group(group_id), servers))
     yield do_return(servers)
@@ -297,7 +302,7 @@ def get_all_launch_server_data(
     """
     return parallel(
         [get_scaling_group_servers(tenant_id, group_id, now)
-         .on(map(NovaServer.from_server_details_json)).on(list),
+         .on(compose(list, map(NovaServer.from_server_details_json))),
          get_clb_contents(),
          get_rcv3_contents()]
     ).on(lambda (servers, clb_nodes_and_clbs, rcv3_nodes): {
@@ -317,7 +322,6 @@ def get_all_launch_stack_data(
 
     Returns an Effect of {'stacks': [HeatStack]}.
     """
-    eff = (get_scaling_group_stacks(group_id)
-           .on(map(HeatStack.from_stack_details_json)).on(list)
-           .on(lambda stacks: {'stacks': stacks}))
-    return eff
+    return get_scaling_group_stacks(group_id).on(
+        lambda stacks: {'stacks': [HeatStack.from_stack_details_json(stack)
+                                   for stack in stacks]})
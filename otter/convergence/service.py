@@ -558,18 +558,17 @@ def get_my_divergent_groups(my_buckets, all_buckets, divergent_flags):
     :returns: list of dicts, where each dict has ``tenant_id``,
         ``group_id``, and ``dirty-flag`` keys.
     """
-    def structure_info(path):
-        # Names of the dirty flags are {tenant_id}_{group_id}.
-        tenant, group = parse_dirty_flag(path)
-        return {'tenant_id': tenant,
-                'group_id': group,
-                'dirty-flag': CONVERGENCE_DIRTY_DIR + '/' + path}
-
-    dirty_info = map(structure_info, divergent_flags)
+    my_buckets = set(my_buckets)
     num_buckets = len(all_buckets)
-    converging = [
-        info for info in dirty_info
-        if bucket_of_tenant(info['tenant_id'], num_buckets) in my_buckets]
+    converging = []
+    for flag in divergent_flags:
+        # Names of the dirty flags are {tenant_id}_{group_id}.
+        tenant, group = parse_dirty_flag(flag)
+        if bucket_of_tenant(tenant, num_buckets) in my_buckets:
+            converging.append(
+                {'tenant_id': tenant,
+                 'group_id': group,
+                 'dirty-flag': CONVERGENCE_DIRTY_DIR + '/' + flag})
     return converging
 
 
@@ -27,12 +27,13 @@ from otter.util.deferredutils import retry_and_timeout
 from otter.util.http import check_success, headers
 from otter.util.retry import (
     TransientRetryError,
-    repeating_interval,
+    exponential_backoff_interval,
     terminal_errors_except
 )
 
 pp = pprint.PrettyPrinter(indent=4)
 verbosity = int(os.environ.get('AS_VERBOSITY', 0))
+test_seed = int(os.environ.get('AS_TEST_SEED', 0))
 
 if verbosity > 0:
     print('Verbosity level ... {0}'.format(verbosity))
@@ -138,7 +139,8 @@ def create_scaling_group_dict(
     Attribute('pool', default_value=None),
     Attribute('reactor', default_value=None),
     Attribute('treq', default_value=treq),
-    Attribute('server_client', default_value=NovaServer)
+    Attribute('server_client', default_value=NovaServer),
+    Attribute('rng', default_factory=lambda: random.Random(test_seed))
 ])
 class ScalingGroup(object):
     """This class encapsulates a scaling group resource.  It provides a means
@@ -158,6 +160,10 @@ class ScalingGroup(object):
     :ivar treq: the treq module to use for making requests - if not provided,
         the default library :mod:`treq` will be used.  Mainly to be used for
         injecting stubs during tests.
+
+    :ivar rng: the :class:`random.Random` used to pick servers - if not
+        provided, each group gets its own, seeded from ``AS_TEST_SEED`` so
+        that runs can be replayed deterministically.
     """
 
     def _endpoint(self, rcs):
@@ -462,7 +468,7 @@ class ScalingGroup(object):
         code, body = yield self.get_scaling_group_state(rcs, [200])
 
         ids = extract_active_ids(body)
-        returnValue(random.sample(ids, n))
+        returnValue(self.rng.sample(ids, n))
 
     @diagnose("AS", "Pausing scaling group")
     def pause(self, rcs):
@@ -496,7 +502,8 @@ class ScalingGroup(object):
         return d.addCallback(check_success, [202])
 
     @diagnose("AS", "Wait for scaling group state to reach a particular point")
-    def wait_for_state(self, rcs, matcher, timeout=600, period=10, clock=None):
+    def wait_for_state(self, rcs, matcher, timeout=600, period=10,
+                       max_period=15, clock=None):
         """
         Wait for the state on the scaling group to match the provided matchers,
         specified by matcher.
@@ -508,7 +515,10 @@ class ScalingGroup(object):
             http://testtools.readthedocs.org/en/latest/api.html.
         :param timeout: The amount of time to wait until this step is
             considered failed.
-        :param period: How long to wait before polling again.
+        :param period: How long to wait before polling again the first time.
+            Every subsequent wait is twice as long as the previous one, up to
+            ``max_period``, so long waits do not poll needlessly often.
+        :param max_period: The longest to wait between two polls. Default 15
         :param clock: a :class:`twisted.internet.interfaces.IReactorTime`
             provider
 
@@ -550,7 +560,8 @@ class ScalingGroup(object):
         return retry_and_timeout(
             poll, timeout,
             can_retry=terminal_errors_except(TransientRetryError),
-            next_interval=repeating_interval(period),
+            next_interval=exponential_backoff_interval(
+                period, maximum=max(period, max_period)),
             clock=clock or reactor,
             deferred_description=(
                 "Waiting for group {} to reach state {}"
@@ -567,8 +578,8 @@ Matcher that asserts something about the number of active servers on the group.
 
 ExcludesServers = MatchesPredicateWithParams(
     lambda state, server_ids:
-        not set(server['id'] for server in state['active']).intersection(
-            set(server_ids)),
+        frozenset(server_ids).isdisjoint(
+            server['id'] for server in state['active']),
     "State {0} should not contain any of the following server IDs: {1}"
 )
 """
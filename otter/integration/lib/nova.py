@@ -1,6 +1,7 @@
 """Contains reusable classes relating to nova."""
 import json
 
+from functools import partial
 from operator import itemgetter
 
 from characteristic import Attribute, attributes
@@ -8,7 +9,8 @@ from characteristic import Attribute, attributes
 import treq
 
 from twisted.internet import reactor
-from twisted.internet.defer import gatherResults, inlineCallbacks, returnValue
+from twisted.internet.defer import (
+    DeferredSemaphore, gatherResults, inlineCallbacks, returnValue)
 from twisted.python.log import msg
 
 from otter.integration.lib.utils import diagnose
@@ -35,22 +37,29 @@ class NovaServer(object):
         for test injection
     """
     @diagnose("nova", "Deleting server")
-    def delete(self, rcs):
+    def delete(self, rcs, semaphore=None):
         """
         Delete the server.
 
         :param rcs: an instance of
             :class:`otter.integration.lib.resources.TestResources`
+        :param semaphore: an optional :class:`DeferredSemaphore` to hold
+            while each DELETE request is in flight, to limit concurrent
+            requests.  It is not held between attempts, so waiting for
+            Nova to finish deleting the server does not hold up others.
         """
+        url = "{}/servers/{}".format(rcs.endpoints["nova"], self.id)
+        hdrs = headers(str(rcs.token))
+
         def try_delete():
-            d = self.treq.delete(
-                "{}/servers/{}".format(rcs.endpoints["nova"], self.id),
-                headers=headers(str(rcs.token)),
-                pool=self.pool)
+            d = self.treq.delete(url, headers=hdrs, pool=self.pool)
             d.addCallback(check_success, [404], _treq=self.treq)
             d.addCallback(self.treq.content)
             return d
 
+        if semaphore is not None:
+            try_delete = partial(semaphore.run, try_delete)
+
         return retry_and_timeout(
             try_delete, 120,
             can_retry=terminal_errors_except(APIError),
@@ -115,14 +124,21 @@ class NovaServer(object):
 
 
 @diagnose("nova", "Deleting one or more servers")
-def delete_servers(server_ids, rcs, pool, _treq=treq):
+def delete_servers(server_ids, rcs, pool, _treq=treq, limit=8,
+                   clock=reactor):
     """
     Use Nova to delete multiple servers.
 
     :param iterable server_ids: The IDs of the servers to delete
+    :param int limit: Maximum number of DELETE requests in flight at once,
+        so a large batch does not tie up every connection in the pool
     """
-    return gatherResults([NovaServer(id=_id, pool=pool, treq=_treq).delete(rcs)
-                          for _id in server_ids])
+    sem = DeferredSemaphore(limit)
+    return gatherResults(
+        [NovaServer(id=_id, pool=pool, treq=_treq, clock=clock).delete(
+            rcs, semaphore=sem)
+         for _id in server_ids],
+        consumeErrors=True)
 
 
 @diagnose("nova", "Listing all servers")
@@ -2,6 +2,8 @@
 
 from __future__ import print_function
 
+import random
+
 from characteristic import attributes
 
 from twisted.internet import defer
@@ -75,17 +77,21 @@ class WaitForStateTestCase(SynchronousTestCase):
 
     def test_poll_until_happy(self):
         """When wait_for_state completes before timeout, we expect our
-        deferred to fire successfully.
+        deferred to fire successfully.  The time between polls doubles, up
+        to ``max_period``.
         """
         self.sg.group_id = 'abc'
         self.sg.get_scaling_group_state = self.get_scaling_group_state_happy
-        self.threshold = 25
+        self.threshold = 6
 
         d = self.sg.wait_for_state(None, HasActive(2), clock=self.clock)
-        for _ in range(24):
-            self.clock.advance(10)
+        for interval in [10, 15, 15, 15, 15]:
             self.assertNoResult(d)
-        self.clock.advance(10)
+            self.clock.advance(interval - 1)
+            self.assertNoResult(d)
+            self.clock.advance(1)
+        self.assertNoResult(d)
+        self.clock.advance(15)
         self.successResultOf(d)
 
     def test_poll_until_timeout(self):
@@ -216,3 +222,35 @@ class GetServicenetIPs(SynchronousTestCase):
         self.assertEqual({'11': '10.0.0.1', '12': '10.0.0.2'},
                          self.successResultOf(d))
         self.assertEqual(['11', '12'], self.queried_server_ids)
+
+
+class ChooseRandomServersTestCase(SynchronousTestCase):
+    """
+    Tests for :func:`ScalingGroup.choose_random_servers`.
+    """
+    def setUp(self):
+        """Create a scaling group with some active servers."""
+        def get_scaling_group_state(_, success_codes):
+            return defer.succeed((
+                200, {'group': {'active': [{'id': str(i)}
+                                           for i in range(10)]}}))
+
+        self.sg = ScalingGroup(group_config={}, rng=random.Random(42))
+        self.sg.get_scaling_group_state = get_scaling_group_state
+
+    def test_uses_rng(self):
+        """
+        Servers are sampled from the active servers using the group's random
+        number generator, so the same seed picks the same servers.
+        """
+        d = self.sg.choose_random_servers(None, 3)
+        self.assertEqual(self.successResultOf(d),
+                         random.Random(42).sample(map(str, range(10)), 3))
+
+    def test_default_rng_per_group(self):
+        """
+        Groups created without an explicit RNG each get their own, so picking
+        servers in one group does not change the picks in another.
+        """
+        self.assertIsNot(ScalingGroup(group_config={}).rng,
+                         ScalingGroup(group_config={}).rng)
@@ -126,7 +126,7 @@ class CLBTests(SynchronousTestCase):
         d = mutate_callable(clb, clock)
         self.assertNoResult(d)
 
-        for _ in range((timeout - 1) / 3):
+        for _ in range((timeout - 1) // 3):
             clock.pump([3])
             self.assertNoResult(d)
 
@@ -353,7 +353,7 @@ class CLBTests(SynchronousTestCase):
         self.assertNoResult(d)
 
         timeout = 60
-        for _ in range((timeout - 1) / 3):
+        for _ in range((timeout - 1) // 3):
             clock.pump([3])
             self.assertNoResult(d)
 
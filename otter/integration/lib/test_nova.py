@@ -3,7 +3,7 @@ import json
 
 from testtools.matchers import Contains, Equals, MatchesListwise
 
-from twisted.internet.defer import succeed
+from twisted.internet.defer import Deferred, succeed
 from twisted.internet.task import Clock
 from twisted.trial.unittest import SynchronousTestCase
 
@@ -180,6 +180,69 @@ class NovaServerCollectionTestCase(SynchronousTestCase):
         d = nova.create_server(self.rcs, self.pool, {'server': {}}, _treq=treq)
         self.assertEqual("12345", self.successResultOf(d))
 
+    def pending_delete_treq(self):
+        """
+        Return a fake treq whose DELETE requests stay pending until fired,
+        and the list of ``(url, deferred)`` for each DELETE made so far.
+        """
+        deletes = []
+
+        class FakeTreq(object):
+            def delete(cls, url, **kwargs):
+                d = Deferred()
+                deletes.append((url, d))
+                return d
+
+            def content(cls, resp):
+                return succeed("")
+
+        return FakeTreq(), deletes
+
+    def test_delete_servers_limits_concurrency(self):
+        """
+        :func:`delete_servers` deletes all the servers, but has no more than
+        ``limit`` DELETE requests in flight at any time.
+        """
+        treq, deletes = self.pending_delete_treq()
+        d = nova.delete_servers(['s{}'.format(i) for i in range(5)],
+                                self.rcs, self.pool, _treq=treq,
+                                limit=2, clock=Clock())
+        self.assertEqual([url for url, _ in deletes],
+                         ['novaurl/servers/s0', 'novaurl/servers/s1'])
+        for i in range(5):
+            deletes[i][1].callback(Response(404))
+        self.assertEqual([url for url, _ in deletes],
+                         ['novaurl/servers/s{}'.format(i) for i in range(5)])
+        self.successResultOf(d)
+
+    def test_delete_servers_waits_without_holding_slot(self):
+        """
+        A server that Nova has not finished deleting yet does not hold up
+        the servers queued behind it while :func:`delete_servers` waits to
+        try it again.
+        """
+        clock = Clock()
+        treq, deletes = self.pending_delete_treq()
+        d = nova.delete_servers(['s0', 's1', 's2'], self.rcs, self.pool,
+                                _treq=treq, limit=2, clock=clock)
+        self.assertEqual(len(deletes), 2)
+
+        # s0 and s1 are not gone yet, but s2 can be deleted meanwhile
+        deletes[0][1].callback(Response(204))
+        deletes[1][1].callback(Response(204))
+        self.assertEqual([url for url, _ in deletes],
+                         ['novaurl/servers/s0', 'novaurl/servers/s1',
+                          'novaurl/servers/s2'])
+        deletes[2][1].callback(Response(404))
+
+        # s0 and s1 are tried again, and are gone this time
+        clock.advance(5)
+        self.assertEqual([url for url, _ in deletes[3:]],
+                         ['novaurl/servers/s0', 'novaurl/servers/s1'])
+        deletes[3][1].callback(Response(404))
+        deletes[4][1].callback(Response(404))
+        self.successResultOf(d)
+
 
 class NovaWaitForServersTestCase(SynchronousTestCase):
     """
@@ -13,6 +13,8 @@ from testtools.matchers import (
     MatchesAll)
 
 from twisted.internet import reactor
+from twisted.internet.task import deferLater
+from twisted.internet.tcp import Client
 
 from twisted.internet.defer import (
     Deferred, gatherResults, inlineCallbacks, returnValue)
@@ -209,13 +211,26 @@ class TestHelper(object):
         """
         setup_test_log_observer(test_case)
         self.test_case = test_case
-        self.pool = HTTPConnectionPool(reactor, False)
+        # Keep connections alive so that batches of requests (such as
+        # deleting servers, 8 at a time) reuse warm TLS connections
+        self.pool = HTTPConnectionPool(reactor, persistent=True)
+        self.pool.maxPersistentPerHost = 8
         self.treq = LoggingTreq(log=log, log_response=True)
-        self.test_case.addCleanup(self.pool.closeCachedConnections)
+        self.test_case.addCleanup(self._close_pool)
 
         self.clbs = [CloudLoadBalancer(pool=self.pool, treq=self.treq)
                      for _ in range(num_clbs)]
 
+    def _close_pool(self):
+        """
+        Close the pool's cached connections, and wait until their sockets
+        have left the reactor so the test does not leave it dirty.
+        """
+        def _check_fds(_):
+            if any(isinstance(fd, Client) for fd in reactor.getReaders()):
+                return deferLater(reactor, 0, _check_fds, None)
+        return self.pool.closeCachedConnections().addBoth(_check_fds)
+
     def create_group(self, **kwargs):
         """
         :return: a tuple of the scaling group with (the helper's pool) and
@@ -317,6 +332,7 @@ class TestHelper(object):
             create_server(rcs, self.pool, server_args) for _ in range(num)])
 
         self.test_case.addCleanup(delete_servers, server_ids, rcs, self.pool)
+        server_ids = frozenset(server_ids)
 
         servers = yield wait_for_servers(
             rcs,
@@ -105,12 +105,13 @@ class TestConvergence(unittest.TestCase):
                 return then(response)
 
         def keep_state(response):
-            self.untouchable_group_ids = extract_active_ids(response)
+            self.untouchable_group_ids = frozenset(
+                extract_active_ids(response))
             return rcs
 
         def double_check_state(response):
             latest_ids = extract_active_ids(response)
-            if not all(i in self.untouchable_group_ids for i in latest_ids):
+            if not self.untouchable_group_ids.issuperset(latest_ids):
                 raise Exception("Untouchable group mutilated somehow.")
             return rcs
 
@@ -617,7 +618,7 @@ class ConvergenceTestsNoLBs(unittest.TestCase):
         max_servers = 10
 
         return _oob_disable_then(
-            self.helper, self.rcs, num_to_disable=set_to_servers / 2,
+            self.helper, self.rcs, num_to_disable=set_to_servers // 2,
             disabler=_deleter,
             then=lambda helper, rcs, group: group.update_group_config(
                 rcs, maxEntities=max_servers + 2),
@@ -17,6 +17,7 @@ from otter import controller
 from otter.json_schema import group_schemas, rest_schemas
 from otter.log import log
 from otter.log.bound import bound_log_kwargs
+from otter.rest.bobby import get_bobby
 from otter.rest.decorators import (
     auditable, fails_with, paginatable, succeeds_with, validate_body,
     with_transaction_id)
@@ -235,8 +236,6 @@ class OtterPolicies(object):
                                          policy_item['args']['alarm_criteria']['criteria'])
             return d.addCallback(lambda _: policy_list)
 
-        from otter.rest.bobby import get_bobby
-
         bobby = get_bobby()
         e = extra_policy_validation(data, bobby)
         if e is not None:
@@ -2,11 +2,12 @@
 
 import json
 
-from pyrsistent import pset
+from pyrsistent import freeze, pset
 
 from twisted.trial.unittest import SynchronousTestCase
 
 from otter.convergence.composition import (
+    _BoundedCache,
     get_desired_server_group_state,
     get_desired_stack_group_state,
     json_to_LBConfigs,
@@ -45,6 +46,52 @@ class JsonToLBConfigTests(SynchronousTestCase):
                 RCv3Description(lb_id='cebdc220-172f-4b10-9f29-9c7e980ba41d')
             ]))
 
+    def test_ignores_unknown_type(self):
+        """
+        LB configs of an unknown type are ignored, even without a
+        ``loadBalancerId``.
+        """
+        self.assertEqual(
+            json_to_LBConfigs([{'type': 'Unknown'},
+                               {'loadBalancerId': 20, 'port': 80}]),
+            pset([CLBDescription(lb_id='20', port=80)]))
+
+    def test_memoized(self):
+        """
+        Equal LB configs, whether frozen or not, return the very same result.
+        """
+        lbs_json = [{'loadBalancerId': 20, 'port': 80},
+                    {'loadBalancerId': 20, 'type': 'RackConnectV3'}]
+        result = json_to_LBConfigs(lbs_json)
+        self.assertIs(json_to_LBConfigs(list(lbs_json)), result)
+        self.assertIs(json_to_LBConfigs(freeze(lbs_json)), result)
+
+
+class BoundedCacheTests(SynchronousTestCase):
+    """Tests for :class:`_BoundedCache`."""
+
+    def test_clears_when_full(self):
+        """
+        Once full, setting a new key forgets all the existing entries.
+        """
+        cache = _BoundedCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache['a'] = 3
+        self.assertEqual(cache, {'a': 3, 'b': 2})
+        cache['c'] = 4
+        self.assertEqual(cache, {'c': 4})
+
+    def test_inspectable(self):
+        """
+        The cache can be iterated over and repr'd like any other dict.
+        """
+        cache = _BoundedCache(3)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(sorted(cache.items()), [('a', 1), ('b', 2)])
+        self.assertEqual(repr(cache), repr({'a': 1, 'b': 2}))
+
 
 class GetDesiredServerGroupStateTests(SynchronousTestCase):
     """Tests for :func:`get_desired_server_group_state`."""
@@ -181,6 +228,30 @@ class FeatureFlagTest(SynchronousTestCase):
                                            get_config_value),
                          False)
 
+    def test_config_change(self):
+        """
+        A change to the `non-convergence-tenants` config is honored, even
+        after the previous value has been checked.
+        """
+        config = {"non-convergence-tenants": ["t1"]}
+        self.assertFalse(tenant_is_enabled("t1", config.get))
+        self.assertTrue(tenant_is_enabled("t2", config.get))
+        config["non-convergence-tenants"] = ["t2"]
+        self.assertTrue(tenant_is_enabled("t1", config.get))
+        self.assertFalse(tenant_is_enabled("t2", config.get))
+
+    def test_config_changed_in_place(self):
+        """
+        A change made in place to the `non-convergence-tenants` list is
+        honored, even after the previous value has been checked.
+        """
+        config = {"non-convergence-tenants": ["t1"]}
+        self.assertFalse(tenant_is_enabled("t1", config.get))
+        config["non-convergence-tenants"].append("t2")
+        self.assertFalse(tenant_is_enabled("t2", config.get))
+        config["non-convergence-tenants"].remove("t1")
+        self.assertTrue(tenant_is_enabled("t1", config.get))
+
     def test_unconfigured(self):
         """
         When no `non-convergence-tenants` key is available in the config,
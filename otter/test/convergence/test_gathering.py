@@ -271,7 +271,8 @@ class GetScalingGroupServersTests(SynchronousTestCase):
             {'id': 'a', 'b': 'c', 'metadata': {asmetakey: "gid"}},
             {'id': 'z', 'z': 'w', 'metadata': {asmetakey: "gid"}},  # new
             {'id': 'd', 'metadata': {"changed": "yes"}},
-            {'id': 'c', 'metadata': {asmetakey: "gid"}}]
+            {'id': 'c', 'metadata': {asmetakey: "gid"}},
+            {'id': 'o', 'metadata': {asmetakey: "other"}}]  # other group
         last_update = datetime(2010, 5, 20)
         sequence = [
             (("cachegstidgid", False), lambda i: (cache, last_update)),
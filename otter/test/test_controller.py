@@ -26,6 +26,7 @@ from otter.cloud_client import (
     get_server_details,
     set_nova_metadata_item)
 from otter.convergence.planning import DRAINING_METADATA
+from otter.log.bound import BoundLog
 from otter.log.intents import BoundFields, Log
 from otter.models.intents import GetScalingGroupInfo, ModifyGroupStatePaused
 from otter.models.interface import (
@@ -150,6 +151,79 @@ class PauseGroupTests(SynchronousTestCase):
             "transid", self.group, object())
 
 
+# A log that discards everything, for tests that don't check logging
+_null_log = BoundLog(lambda *a, **kw: None, lambda *a, **kw: None)
+
+# (case, policy, config, active, pending, expected delta, expected desired)
+_calculate_delta_cases = (
+    ('positive change within min and max',
+     {'change': 5}, {'minEntities': 0, 'maxEntities': 300}, 5, 0, 5, 10),
+    ('positive change will hit max',
+     {'change': 5}, {'minEntities': 0, 'maxEntities': 10}, 4, 4, 2, 10),
+    ('positive change but at max',
+     {'change': 5}, {'minEntities': 0, 'maxEntities': 10}, 5, 5, 0, 10),
+    ('positive change but at default max',
+     {'change': 5}, {'minEntities': 0, 'maxEntities': None}, 5, 5, 0, 10),
+    ('negative change within min and max',
+     {'change': -5}, {'minEntities': 0, 'maxEntities': 30}, 10, 0, -5, 5),
+    ('negative change will hit min',
+     {'change': -5}, {'minEntities': 5, 'maxEntities': 10}, 4, 4, -3, 5),
+    ('negative change but at min',
+     {'change': -5}, {'minEntities': 5, 'maxEntities': 10}, 0, 5, 0, 5),
+    ('percent positive change within min and max',
+     {'changePercent': 20}, {'minEntities': 0, 'maxEntities': 300}, 5, 0,
+     1, 6),
+    ('percent positive change will hit max',
+     {'changePercent': 75}, {'minEntities': 0, 'maxEntities': 10}, 4, 4,
+     2, 10),
+    ('percent positive change but at max',
+     {'changePercent': 50}, {'minEntities': 0, 'maxEntities': 10}, 5, 5,
+     0, 10),
+    ('percent positive change but at default max',
+     {'changePercent': 50}, {'minEntities': 0, 'maxEntities': None}, 5, 5,
+     0, 10),
+    ('percent negative change within min and max',
+     {'changePercent': -50}, {'minEntities': 0, 'maxEntities': 30}, 10, 0,
+     -5, 5),
+    ('percent negative change will hit min',
+     {'changePercent': -80}, {'minEntities': 5, 'maxEntities': 10}, 4, 4,
+     -3, 5),
+    ('percent negative change but at min',
+     {'changePercent': -50}, {'minEntities': 5, 'maxEntities': 10}, 0, 5,
+     0, 5),
+    ('desired positive change within min and max',
+     {'desiredCapacity': 25}, {'minEntities': 0, 'maxEntities': 300}, 5, 0,
+     20, 25),
+    ('desired positive change will hit max',
+     {'desiredCapacity': 15}, {'minEntities': 0, 'maxEntities': 10}, 4, 4,
+     2, 10),
+    ('desired positive change but at max',
+     {'desiredCapacity': 15}, {'minEntities': 0, 'maxEntities': 10}, 5, 5,
+     0, 10),
+    ('desired positive change but at default max',
+     {'desiredCapacity': 15}, {'minEntities': 0, 'maxEntities': None}, 5, 5,
+     0, 10),
+    ('desired will hit min',
+     {'desiredCapacity': 3}, {'minEntities': 5, 'maxEntities': 10}, 4, 4,
+     -3, 5),
+    ('desired at min',
+     {'desiredCapacity': 3}, {'minEntities': 5, 'maxEntities': 10}, 0, 5,
+     0, 5),
+    ('zero change within min and max',
+     {'change': 0}, {'minEntities': 1, 'maxEntities': 10}, 5, 0, 0, 5),
+    ('zero change below min',
+     {'change': 0}, {'minEntities': 5, 'maxEntities': 10}, 0, 0, 5, 5),
+    ('zero change above max',
+     {'change': 0}, {'minEntities': 0, 'maxEntities': 2}, 5, 0, -3, 2),
+)
+
+# (policy, expected desired, expected delta) with 5 pending servers
+_percent_rounding_cases = (
+    ({'changePercent': 50}, 8, 3), ({'changePercent': 5}, 6, 1),
+    ({'changePercent': 75}, 9, 4), ({'changePercent': -50}, 2, -3),
+    ({'changePercent': -5}, 4, -1), ({'changePercent': -75}, 1, -4))
+
+
 class CalculateDeltaTestCase(SynchronousTestCase):
     """
     Tests for :func:`otter.controller.calculate_delta`
@@ -157,263 +231,38 @@ class CalculateDeltaTestCase(SynchronousTestCase):
 
     def setUp(self):
         """
-        Set the max and add a mock log
+        Set the max and use a no-op log
         """
         patcher = mock.patch.object(controller, 'MAX_ENTITIES', new=10)
         patcher.start()
         self.addCleanup(patcher.stop)
-        self.mock_log = mock.Mock()
+        self.mock_log = _null_log
 
     def get_state(self, active, pending):
         """
-        Only care about the active and pending values, so generate a whole
-        :class:`GroupState` with other fake info
+        Only care about the number of active and pending servers, so generate
+        a whole :class:`GroupState` with other fake info
         """
-        return GroupState('1', '1', "test", active, pending, None, {}, False,
+        return GroupState('1', '1', "test", dict.fromkeys(range(active)),
+                          dict.fromkeys(range(pending)), None, {}, False,
                           ScalingGroupStatus.ACTIVE)
 
-    def test_positive_change_within_min_max(self):
-        """
-        If the policy is a scale up by a fixed number,
-        and a min and max are given,
-        and the desired number of servers fall between the min and the max,
-        then ``calculate_delta`` returns a delta that is just the policy
-        change.
-        """
-        fake_policy = {'change': 5}
-        fake_config = {'minEntities': 0, 'maxEntities': 300}
-        fake_state = self.get_state(dict.fromkeys(range(5)), {})
-
-        self.assertEqual(5, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 10)
-
-    def test_positive_change_will_hit_max(self):
-        """
-        If the policy is a scale up by a fixed number,
-        and a min and max are given,
-        and the desired number is above the max,
-        then ``calculate_delta`` returns a truncated delta.
-        """
-        fake_policy = {'change': 5}
-        fake_config = {'minEntities': 0, 'maxEntities': 10}
-        fake_state = self.get_state(dict.fromkeys(range(4)),
-                                    dict.fromkeys(range(4)))
-
-        self.assertEqual(2, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 10)
-
-    def test_positive_change_but_at_max(self):
+    def test_calculate_delta_table(self):
         """
-        If the policy is a scale up by a fixed number,
-        and a min and max are given,
-        and the current active + pending is at the max already,
-        then ``calculate_delta`` returns 0.
+        ``calculate_delta`` returns the policy's change, constrained to the
+        group's min and max (or the default max), and updates the state's
+        desired capacity accordingly.  See ``_calculate_delta_cases`` for the
+        individual cases.
         """
-        fake_policy = {'change': 5}
-        fake_config = {'minEntities': 0, 'maxEntities': 10}
-        fake_state = self.get_state(dict.fromkeys(range(5)),
-                                    dict.fromkeys(range(5)))
-
-        self.assertEqual(0, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 10)
-
-    def test_positive_change_but_at_default_max(self):
-        """
-        If the policy is a scale up by a fixed number,
-        and a min and no max,
-        and the current active + pending is at the default max already,
-        then ``calculate_delta`` returns 0.
-        """
-        fake_policy = {'change': 5}
-        fake_config = {'minEntities': 0, 'maxEntities': None}
-        fake_state = self.get_state(dict.fromkeys(range(5)),
-                                    dict.fromkeys(range(5)))
-
-        self.assertEqual(0, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 10)
-
-    def test_negative_change_within_min_max(self):
-        """
-        If the policy is a scale down by a fixed number,
-        and a min and max are given,
-        and the desired number of servers fall between the min and the max,
-        then ``calculate_delta`` returns a delta that is just the policy
-        change.
-        """
-        fake_policy = {'change': -5}
-        fake_config = {'minEntities': 0, 'maxEntities': 30}
-        fake_state = self.get_state(dict.fromkeys(range(10)), {})
-
-        self.assertEqual(-5, controller.calculate_delta(self.mock_log,
-                                                        fake_state,
-                                                        fake_config,
-                                                        fake_policy))
-        self.assertEqual(fake_state.desired, 5)
-
-    def test_negative_change_will_hit_min(self):
-        """
-        If the policy is a scale down by a fixed number,
-        and a min and max are given,
-        and the desired number is below the min,
-        then ``calculate_delta`` returns a truncated delta.
-        """
-        fake_policy = {'change': -5}
-        fake_config = {'minEntities': 5, 'maxEntities': 10}
-        fake_state = self.get_state(dict.fromkeys(range(4)),
-                                    dict.fromkeys(range(4)))
-
-        self.assertEqual(-3, controller.calculate_delta(self.mock_log,
-                                                        fake_state,
-                                                        fake_config,
-                                                        fake_policy))
-        self.assertEqual(fake_state.desired, 5)
-
-    def test_negative_change_but_at_min(self):
-        """
-        If the policy is a scale down by a fixed number,
-        and a min and max are given,
-        and the current active + pending is at the min already,
-        then ``calculate_delta`` returns 0.
-        """
-        fake_policy = {'change': -5}
-        fake_config = {'minEntities': 5, 'maxEntities': 10}
-        fake_state = self.get_state({}, dict.fromkeys(range(5)))
-
-        self.assertEqual(0, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 5)
-
-    def test_percent_positive_change_within_min_max(self):
-        """
-        If the policy is a scale up by x% and a min and max are given,
-        and the desired number of servers fall between the min and the max,
-        then ``calculate_delta`` returns a delta that is just the policy
-        change.
-        """
-        fake_policy = {'changePercent': 20}
-        fake_config = {'minEntities': 0, 'maxEntities': 300}
-        fake_state = self.get_state(dict.fromkeys(range(5)), {})
-
-        self.assertEqual(1, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 6)
-
-    def test_percent_positive_change_will_hit_max(self):
-        """
-        If the policy is a scale up by x% and a min and max are given,
-        and the desired number is above the max,
-        then ``calculate_delta`` returns a truncated delta.
-        """
-        fake_policy = {'changePercent': 75}
-        fake_config = {'minEntities': 0, 'maxEntities': 10}
-        fake_state = self.get_state(dict.fromkeys(range(4)),
-                                    dict.fromkeys(range(4)))
-
-        self.assertEqual(2, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 10)
-
-    def test_percent_positive_change_but_at_max(self):
-        """
-        If the policy is a scale up by x% and a min and max are given,
-        and the current active + pending is at the max already,
-        then ``calculate_delta`` returns 0.
-        """
-        fake_policy = {'changePercent': 50}
-        fake_config = {'minEntities': 0, 'maxEntities': 10}
-        fake_state = self.get_state(dict.fromkeys(range(5)),
-                                    dict.fromkeys(range(5)))
-
-        self.assertEqual(0, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 10)
-
-    def test_percent_positive_change_but_at_default_max(self):
-        """
-        If the policy is a scale up by x% and a min and no max,
-        and the current active + pending is at the default max already,
-        then ``calculate_delta`` returns 0.
-        """
-        fake_policy = {'changePercent': 50}
-        fake_config = {'minEntities': 0, 'maxEntities': None}
-        fake_state = self.get_state(dict.fromkeys(range(5)),
-                                    dict.fromkeys(range(5)))
-
-        self.assertEqual(0, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 10)
-
-    def test_percent_negative_change_within_min_max(self):
-        """
-        If the policy is a scale down by x% and a min and max are given,
-        and the desired number of servers fall between the min and the max,
-        then ``calculate_delta`` returns a delta that is just the policy
-        change.
-        """
-        fake_policy = {'changePercent': -50}
-        fake_config = {'minEntities': 0, 'maxEntities': 30}
-        fake_state = self.get_state(dict.fromkeys(range(10)), {})
-
-        self.assertEqual(-5, controller.calculate_delta(self.mock_log,
-                                                        fake_state,
-                                                        fake_config,
-                                                        fake_policy))
-        self.assertEqual(fake_state.desired, 5)
-
-    def test_percent_negative_change_will_hit_min(self):
-        """
-        If the policy is a scale down by x% and a min and max are given,
-        and the desired number is below the min,
-        then ``calculate_delta`` returns a truncated delta.
-        """
-        fake_policy = {'changePercent': -80}
-        fake_config = {'minEntities': 5, 'maxEntities': 10}
-        fake_state = self.get_state(dict.fromkeys(range(4)),
-                                    dict.fromkeys(range(4)))
-
-        self.assertEqual(-3, controller.calculate_delta(self.mock_log,
-                                                        fake_state,
-                                                        fake_config,
-                                                        fake_policy))
-        self.assertEqual(fake_state.desired, 5)
-
-    def test_percent_negative_change_but_at_min(self):
-        """
-        If the policy is a scale down by x% and a min and max are given,
-        and the current active + pending is at the min already,
-        then ``calculate_delta`` returns 0.
-        """
-        fake_policy = {'changePercent': -50}
-        fake_config = {'minEntities': 5, 'maxEntities': 10}
-        fake_state = self.get_state({}, dict.fromkeys(range(5)))
-
-        self.assertEqual(0, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 5)
+        for (case, policy, config, active, pending, expected_delta,
+             expected_desired) in _calculate_delta_cases:
+            state = self.get_state(active, pending)
+            self.assertEqual(
+                (expected_delta, expected_desired),
+                (controller.calculate_delta(self.mock_log, state, config,
+                                            policy),
+                 state.desired),
+                case)
 
     def test_percent_rounding(self):
         """
@@ -421,121 +270,15 @@ class CalculateDeltaTestCase(SynchronousTestCase):
         away from zero.
         """
         fake_config = {'minEntities': 0, 'maxEntities': 10}
-        fake_state = self.get_state({}, dict.fromkeys(range(5)))
-
-        test_cases = [
-            (50, 8, 3), (5, 6, 1), (75, 9, 4),
-            (-50, 2, -3), (-5, 4, -1), (-75, 1, -4)]
-
-        for change_percent, expected_desired, expected_delta in test_cases:
-            fake_policy = {'changePercent': change_percent}
-            self.assertEqual(expected_delta,
-                             controller.calculate_delta(self.mock_log,
-                                                        fake_state,
-                                                        fake_config,
-                                                        fake_policy))
-            self.assertEqual(fake_state.desired, expected_desired)
-
-    def test_desired_positive_change_within_min_max(self):
-        """
-        If the policy is based on desiredCapacity and a min and max are given,
-        and the desired number of servers fall between the min and the max,
-        then ``calculate_delta`` returns a delta that is just the policy
-        change.
-        """
-        fake_policy = {'desiredCapacity': 25}
-        fake_config = {'minEntities': 0, 'maxEntities': 300}
-        fake_state = self.get_state(dict.fromkeys(range(5)), {})
-
-        self.assertEqual(20, controller.calculate_delta(self.mock_log,
-                                                        fake_state,
-                                                        fake_config,
-                                                        fake_policy))
-        self.assertEqual(fake_state.desired, 25)
-
-    def test_desired_positive_change_will_hit_max(self):
-        """
-        If the policy is based on desiredCapacity and a min and max are given,
-        and the desired number is above the max,
-        then ``calculate_delta`` returns a truncated delta.
-        """
-        fake_policy = {'desiredCapacity': 15}
-        fake_config = {'minEntities': 0, 'maxEntities': 10}
-        fake_state = self.get_state(dict.fromkeys(range(4)),
-                                    dict.fromkeys(range(4)))
-
-        self.assertEqual(2, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 10)
-
-    def test_desired_positive_change_but_at_max(self):
-        """
-        If the policy is based on desiredCapacity  and a min and max are given,
-        and the current active + pending is at the max already,
-        then ``calculate_delta`` returns 0.
-        """
-        fake_policy = {'desiredCapacity': 15}
-        fake_config = {'minEntities': 0, 'maxEntities': 10}
-        fake_state = self.get_state(dict.fromkeys(range(5)),
-                                    dict.fromkeys(range(5)))
-
-        self.assertEqual(0, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 10)
-
-    def test_desired_positive_change_but_at_default_max(self):
-        """
-        If the policy is based on desiredCapacity and a min and no max,
-        and the current active + pending is at the default max already,
-        then ``calculate_delta`` returns 0.
-        """
-        fake_policy = {'desiredCapacity': 15}
-        fake_config = {'minEntities': 0, 'maxEntities': None}
-        fake_state = self.get_state(dict.fromkeys(range(5)),
-                                    dict.fromkeys(range(5)))
-
-        self.assertEqual(0, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 10)
-
-    def test_desired_will_hit_min(self):
-        """
-        If the policy is based on desiredCapacity and a min and max are given,
-        and the desired number is below the min,
-        then ``calculate_delta`` returns a truncated delta.
-        """
-        fake_policy = {'desiredCapacity': 3}
-        fake_config = {'minEntities': 5, 'maxEntities': 10}
-        fake_state = self.get_state(dict.fromkeys(range(4)),
-                                    dict.fromkeys(range(4)))
-
-        self.assertEqual(-3, controller.calculate_delta(self.mock_log,
-                                                        fake_state,
-                                                        fake_config,
-                                                        fake_policy))
-        self.assertEqual(fake_state.desired, 5)
-
-    def test_desired_at_min(self):
-        """
-        If the policy is based on desiredCapacity and a min and max are given,
-        and the current active + pending is at the min already,
-        then ``calculate_delta`` returns 0.
-        """
-        fake_policy = {'desiredCapacity': 3}
-        fake_config = {'minEntities': 5, 'maxEntities': 10}
-        fake_state = self.get_state({}, dict.fromkeys(range(5)))
-
-        self.assertEqual(0, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 5)
+        for (policy, expected_desired,
+             expected_delta) in _percent_rounding_cases:
+            fake_state = self.get_state(0, 5)
+            self.assertEqual(
+                (expected_delta, expected_desired),
+                (controller.calculate_delta(self.mock_log, fake_state,
+                                            fake_config, policy),
+                 fake_state.desired),
+                policy)
 
     def test_no_change_or_percent_or_desired_fails(self):
         """
@@ -545,59 +288,12 @@ class CalculateDeltaTestCase(SynchronousTestCase):
         """
         fake_policy = {'changeNone': 5}
         fake_config = {'minEntities': 0, 'maxEntities': 10}
-        fake_state = self.get_state({}, {})
+        fake_state = self.get_state(0, 0)
 
         self.assertRaises(AttributeError,
                           controller.calculate_delta,
                           self.mock_log, fake_state, fake_config, fake_policy)
 
-    def test_zero_change_within_min_max(self):
-        """
-        If 'change' is zero, but the current active + pending is within the min
-        and max, then ``calculate_delta`` returns 0
-        """
-        fake_policy = {'change': 0}
-        fake_config = {'minEntities': 1, 'maxEntities': 10}
-        fake_state = self.get_state(dict.fromkeys(range(5)), {})
-
-        self.assertEqual(0, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 5)
-
-    def test_zero_change_below_min(self):
-        """
-        If 'change' is zero, but the current active + pending is below the min,
-        then ``calculate_delta`` returns the difference between
-        current + pending and the min
-        """
-        fake_policy = {'change': 0}
-        fake_config = {'minEntities': 5, 'maxEntities': 10}
-        fake_state = self.get_state({}, {})
-
-        self.assertEqual(5, controller.calculate_delta(self.mock_log,
-                                                       fake_state,
-                                                       fake_config,
-                                                       fake_policy))
-        self.assertEqual(fake_state.desired, 5)
-
-    def test_zero_change_above_max(self):
-        """
-        If 'change' is zero, but the current active + pending is above the max,
-        then ``calculate_delta`` returns the negative difference between the
-        current + pending and the max
-        """
-        fake_policy = {'change': 0}
-        fake_config = {'minEntities': 0, 'maxEntities': 2}
-        fake_state = self.get_state(dict.fromkeys(range(5)), {})
-
-        self.assertEqual(-3, controller.calculate_delta(self.mock_log,
-                                                        fake_state,
-                                                        fake_config,
-                                                        fake_policy))
-        self.assertEqual(fake_state.desired, 2)
-
     def test_logs_relevant_information(self):
         """
         Log is called with at least the constrained desired capacity and the
@@ -605,10 +301,10 @@ class CalculateDeltaTestCase(SynchronousTestCase):
         """
         fake_policy = {'change': 0}
         fake_config = {'minEntities': 1, 'maxEntities': 10}
-        fake_state = self.get_state({}, {})
-        controller.calculate_delta(self.mock_log, fake_state, fake_config,
-                                   fake_policy)
-        args, kwargs = self.mock_log.msg.call_args
+        fake_state = self.get_state(0, 0)
+        log = mock_log()
+        controller.calculate_delta(log, fake_state, fake_config, fake_policy)
+        args, kwargs = log.msg.call_args
         self.assertEqual(fake_state.desired, 1)
         self.assertEqual(
             args, (('calculating delta {current_active} + {current_pending}'
@@ -618,6 +314,19 @@ class CalculateDeltaTestCase(SynchronousTestCase):
             'constrained_desired_capacity': Equals(1)})))
 
 
+class _FixedNow(object):
+    """
+    Stands in for :class:`datetime.datetime`, whose ``now`` is always the
+    (naive) datetime in ``fixed``, in the requested timezone.
+    """
+    def __init__(self, fixed):
+        self.fixed = fixed
+
+    def now(self, timezone):
+        """Return the fixed datetime in ``timezone``."""
+        return self.fixed.replace(tzinfo=timezone)
+
+
 class CheckCooldownsTestCase(SynchronousTestCase):
     """
     Tests for :func:`otter.controller.check_cooldowns`
@@ -625,9 +334,11 @@ class CheckCooldownsTestCase(SynchronousTestCase):
 
     def setUp(self):
         """
-        Generate a mock log
+        Use a no-op log and patch the controller's datetime
         """
-        self.mock_log = mock.MagicMock()
+        self.mock_log = _null_log
+        self.datetime = _FixedNow(datetime.min)
+        self.patch(controller, 'datetime', self.datetime)
 
     def mock_now(self, seconds_after_min):
         """
@@ -635,12 +346,8 @@ class CheckCooldownsTestCase(SynchronousTestCase):
         so many seconds after `datetime.min`.  Tests using this should set
         the last touched time to be MIN.
         """
-        def _fake_now(timezone):
-            fake_datetime = datetime.min + timedelta(seconds=seconds_after_min)
-            return fake_datetime.replace(tzinfo=timezone)
-
-        self.datetime = patch(self, 'otter.controller.datetime', spec=['now'])
-        self.datetime.now.side_effect = _fake_now
+        self.datetime.fixed = datetime.min + timedelta(
+            seconds=seconds_after_min)
 
     def get_state(self, group_touched, policy_touched):
         """
@@ -1076,6 +783,10 @@ class EmptyGroupTests(SynchronousTestCase):
         self.assertFalse(self.group.modify_state.called)
 
 
+_controller_utilities = ('check_cooldowns', 'calculate_delta',
+                         'exec_scale_down', 'execute_launch_config')
+
+
 def mock_controller_utilities(test_case):
     """
     Mock out the following functions in the controller module, in order
@@ -1086,18 +797,17 @@ def mock_controller_utilities(test_case):
         - exec_scale_down (return a dummy success)
         - execute_launch_config (return a dummy success)
     """
-    mocks = {}
-    things_and_return_vals = {
-        'check_cooldowns': True,
-        'calculate_delta': 1,
-        'exec_scale_down': defer.succeed("scaled down"),
-        'execute_launch_config': defer.succeed("scaled up")
-    }
-
-    for thing, return_val in things_and_return_vals.iteritems():
-        mocks[thing] = patch(test_case, 'otter.controller.{0}'.format(thing),
-                             return_value=return_val)
-
+    patcher = mock.patch.multiple(
+        controller, **dict.fromkeys(_controller_utilities, mock.DEFAULT))
+    mocks = patcher.start()
+    test_case.addCleanup(patcher.stop)
+
+    # The deferreds are made per test (per ``mock_controller_utilities``
+    # call) rather than shared, since tests chain callbacks onto them
+    mocks['check_cooldowns'].return_value = True
+    mocks['calculate_delta'].return_value = 1
+    mocks['exec_scale_down'].return_value = defer.succeed("scaled down")
+    mocks['execute_launch_config'].return_value = defer.succeed("scaled up")
     return mocks
 
 
@@ -1136,6 +846,8 @@ class MaybeExecuteScalingPolicyTestCase(SynchronousTestCase):
         """
         self.mocks = mock_controller_utilities(self)
         self.mock_log = mock.MagicMock()
+        self.bound_log = self.mock_log.bind.return_value
+        self.double_bound_log = self.bound_log.bind.return_value
         self.mock_state = GroupState(
             "tenant", "group", "g", {"a": "a", "b": "b", "c": "c"},
             {"d": "d", "e": "e"}, None, {}, False, ScalingGroupStatus.ACTIVE,
@@ -1143,6 +855,16 @@ class MaybeExecuteScalingPolicyTestCase(SynchronousTestCase):
         self.group = mock_group()
         set_non_conv_tenant("tenant", self)
 
+    def assert_policy_checked(self):
+        """
+        Assert that the policy's cooldowns were checked and its delta
+        calculated, once each, with the bound log.
+        """
+        self.mocks['check_cooldowns'].assert_called_once_with(
+            self.bound_log, self.mock_state, "config", "policy", 'pol1')
+        self.mocks['calculate_delta'].assert_called_once_with(
+            self.bound_log, self.mock_state, "config", "policy")
+
     def test_maybe_execute_scaling_policy_no_such_policy(self):
         """
         If there is no such scaling policy, the whole thing fails and
@@ -1199,14 +921,9 @@ class MaybeExecuteScalingPolicyTestCase(SynchronousTestCase):
         self.mock_log.bind.assert_called_once_with(
             scaling_group_id=self.group.uuid, policy_id='pol1')
 
-        self.mocks['check_cooldowns'].assert_called_once_with(
-            self.mock_log.bind.return_value, self.mock_state, "config",
-            "policy", 'pol1')
-        self.mocks['calculate_delta'].assert_called_once_with(
-            self.mock_log.bind.return_value, self.mock_state, "config",
-            "policy")
+        self.assert_policy_checked()
         self.mocks['execute_launch_config'].assert_called_once_with(
-            self.mock_log.bind.return_value.bind.return_value,
+            self.double_bound_log,
             'transaction', self.mock_state, "launch", self.group,
             self.mocks['calculate_delta'].return_value)
 
@@ -1233,14 +950,9 @@ class MaybeExecuteScalingPolicyTestCase(SynchronousTestCase):
         self.mock_log.bind.assert_called_once_with(
             scaling_group_id=self.group.uuid, policy_id='pol1')
 
-        self.mocks['check_cooldowns'].assert_called_once_with(
-            self.mock_log.bind.return_value, self.mock_state, "config",
-            "policy", 'pol1')
-        self.mocks['calculate_delta'].assert_called_once_with(
-            self.mock_log.bind.return_value, self.mock_state, "config",
-            "policy")
+        self.assert_policy_checked()
         self.mocks['execute_launch_config'].assert_called_once_with(
-            self.mock_log.bind.return_value.bind.return_value,
+            self.double_bound_log,
             'transaction', self.mock_state, "launch", self.group,
             self.mocks['calculate_delta'].return_value)
 
@@ -1263,7 +975,7 @@ class MaybeExecuteScalingPolicyTestCase(SynchronousTestCase):
         self.assertIn("Cooldowns not met", str(f.value))
 
         self.mocks['check_cooldowns'].assert_called_once_with(
-            self.mock_log.bind.return_value, self.mock_state, "config",
+            self.bound_log, self.mock_state, "config",
             "policy", 'pol1')
         self.assertEqual(self.mocks['calculate_delta'].call_count, 0)
         self.assertEqual(self.mocks['execute_launch_config'].call_count, 0)
@@ -1287,12 +999,7 @@ class MaybeExecuteScalingPolicyTestCase(SynchronousTestCase):
         f = self.failureResultOf(d, controller.CannotExecutePolicyError)
         self.assertIn("No change in servers", str(f.value))
 
-        self.mocks['check_cooldowns'].assert_called_once_with(
-            self.mock_log.bind.return_value, self.mock_state, "config",
-            "policy", 'pol1')
-        self.mocks['calculate_delta'].assert_called_once_with(
-            self.mock_log.bind.return_value, self.mock_state, "config",
-            "policy")
+        self.assert_policy_checked()
         self.assertEqual(
             len(self.mocks['execute_launch_config'].mock_calls), 0)
 
@@ -1307,14 +1014,9 @@ class MaybeExecuteScalingPolicyTestCase(SynchronousTestCase):
                                                 self.group, self.mock_state,
                                                 'pol1')
         self.mocks['exec_scale_down'].assert_called_once_with(
-            self.mock_log.bind.return_value.bind.return_value, 'transaction',
+            self.double_bound_log, 'transaction',
             self.mock_state, self.group, 3)
-        self.mocks['check_cooldowns'].assert_called_once_with(
-            self.mock_log.bind.return_value, self.mock_state, "config",
-            "policy", 'pol1')
-        self.mocks['calculate_delta'].assert_called_once_with(
-            self.mock_log.bind.return_value, self.mock_state, "config",
-            "policy")
+        self.assert_policy_checked()
         self.assertEqual(
             len(self.mocks['execute_launch_config'].mock_calls), 0)
 
@@ -1587,6 +1289,14 @@ _should_retry_params = ShouldDelayAndRetry(
     next_interval=exponential_backoff_interval(2))
 
 
+# Nothing changes these intents, so they are built once for all the tests
+_get_details_intent = get_server_details('server_id').intent
+_set_draining_intent = set_nova_metadata_item(
+    'server_id', *DRAINING_METADATA).intent
+_get_group_info_intent = GetScalingGroupInfo(tenant_id='tenant_id',
+                                             group_id='group_id')
+
+
 class ConvergenceRemoveServerTests(SynchronousTestCase):
     """
     Tests for :func:`otter.controller.convergence_remove_server_from_group`,
@@ -1654,6 +1364,26 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
             ])
         )
 
+    def _get_group_info(self):
+        """
+        Return a :class:`SequenceDispatcher` tuple that looks up the group
+        and its manifest.
+        """
+        return (_get_group_info_intent,
+                lambda _: (self.group, self.group_manifest_info))
+
+    def _evict(self, performer, logged_response=True):
+        """
+        Return a :class:`SequenceDispatcher` tuple that evicts the server from
+        the group, performed by ``performer``.
+        """
+        return self._tenant_retry(
+            EvictServerFromScalingGroup(log=self.log,
+                                        transaction_id=self.trans_id,
+                                        scaling_group=self.group,
+                                        server_id='server_id'),
+            performer, logged_response=logged_response)
+
     def _remove(self, replace, purge, seq_dispatcher):
         eff = controller.convergence_remove_server_from_group(
             self.log, self.trans_id, 'server_id', replace, purge,
@@ -1672,7 +1402,7 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
         """
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: raise_(NoSuchServerError(server_id=u'server_id')))
         ])
 
@@ -1689,7 +1419,7 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
         self.server_details['server'].pop('metadata')
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: (StubResponse(200, {}), self.server_details))
         ])
 
@@ -1709,7 +1439,7 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
 
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: (StubResponse(200, {}), self.server_details))
         ])
 
@@ -1727,10 +1457,9 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
 
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: (StubResponse(200, {}), self.server_details)),
-            (GetScalingGroupInfo(tenant_id='tenant_id', group_id='group_id'),
-                lambda _: (self.group, self.group_manifest_info))
+            self._get_group_info()
         ])
         self.assertRaises(
             CannotDeleteServerBelowMinError, self._remove, False, False,
@@ -1747,10 +1476,9 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
 
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: (StubResponse(200, {}), self.server_details)),
-            (GetScalingGroupInfo(tenant_id='tenant_id', group_id='group_id'),
-                lambda _: (self.group, self.group_manifest_info))
+            self._get_group_info()
         ])
         self.assertRaises(
             ServerNotFoundError, self._remove, False, False, seq_dispatcher)
@@ -1764,10 +1492,10 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
         """
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: (StubResponse(200, {}), self.server_details)),
             self._tenant_retry(
-                set_nova_metadata_item('server_id', *DRAINING_METADATA).intent,
+                _set_draining_intent,
                 lambda _: (StubResponse(200, {}), None))
         ])
         result = self._remove(True, True, seq_dispatcher)
@@ -1783,12 +1511,11 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
         old_desired = self.state.desired = 2
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: (StubResponse(200, {}), self.server_details)),
-            (GetScalingGroupInfo(tenant_id='tenant_id', group_id='group_id'),
-                lambda _: (self.group, self.group_manifest_info)),
+            self._get_group_info(),
             self._tenant_retry(
-                set_nova_metadata_item('server_id', *DRAINING_METADATA).intent,
+                _set_draining_intent,
                 lambda _: (StubResponse(200, {}), None))
         ])
         result = self._remove(False, True, seq_dispatcher)
@@ -1803,10 +1530,10 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
         """
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: (StubResponse(200, {}), self.server_details)),
             self._tenant_retry(
-                set_nova_metadata_item('server_id', *DRAINING_METADATA).intent,
+                _set_draining_intent,
                 lambda _: raise_(ValueError('oops!')))
         ])
         self.assertRaises(ValueError, self._remove, True, True, seq_dispatcher)
@@ -1820,15 +1547,10 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
         """
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: (StubResponse(200, {}), self.server_details)),
-            self._tenant_retry(
-                EvictServerFromScalingGroup(log=self.log,
-                                            transaction_id=self.trans_id,
-                                            scaling_group=self.group,
-                                            server_id='server_id'),
-                lambda _: (StubResponse(200, {}), None),
-                logged_response=False)
+            self._evict(lambda _: (StubResponse(200, {}), None),
+                        logged_response=False)
         ])
         result = self._remove(True, False, seq_dispatcher)
         self.assertEqual(result, self.state)
@@ -1843,17 +1565,11 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
         old_desired = self.state.desired = 2
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: (StubResponse(200, {}), self.server_details)),
-            (GetScalingGroupInfo(tenant_id='tenant_id', group_id='group_id'),
-                lambda _: (self.group, self.group_manifest_info)),
-            self._tenant_retry(
-                EvictServerFromScalingGroup(log=self.log,
-                                            transaction_id=self.trans_id,
-                                            scaling_group=self.group,
-                                            server_id='server_id'),
-                lambda _: (StubResponse(200, {}), None),
-                logged_response=False)
+            self._get_group_info(),
+            self._evict(lambda _: (StubResponse(200, {}), None),
+                        logged_response=False)
         ])
         result = self._remove(False, False, seq_dispatcher)
         self.assert_states_equivalent_except_desired(result, self.state)
@@ -1867,14 +1583,9 @@ class ConvergenceRemoveServerTests(SynchronousTestCase):
         """
         seq_dispatcher = SequenceDispatcher([
             self._tenant_retry(
-                get_server_details('server_id').intent,
+                _get_details_intent,
                 lambda _: (StubResponse(200, {}), self.server_details)),
-            self._tenant_retry(
-                EvictServerFromScalingGroup(log=self.log,
-                                            transaction_id=self.trans_id,
-                                            scaling_group=self.group,
-                                            server_id='server_id'),
-                lambda _: raise_(ValueError('oops')))
+            self._evict(lambda _: raise_(ValueError('oops')))
         ])
         self.assertRaises(ValueError, self._remove, True, False,
                           seq_dispatcher)
@@ -407,6 +407,15 @@ class NextIntervalHelperTests(SynchronousTestCase):
         self.assertEqual(next_interval(err), 6)
         self.assertEqual(next_interval(err), 12)
 
+    def test_exp_backoff_interval_maximum(self):
+        """
+        ``exponential_backoff_interval`` never returns more than ``maximum``
+        """
+        err = DummyException()
+        next_interval = exponential_backoff_interval(3, maximum=10)
+        self.assertEqual([next_interval(err) for _ in range(4)],
+                         [3, 6, 10, 10])
+
 
 STUB = Effect(Stub(Constant("foo")))
 
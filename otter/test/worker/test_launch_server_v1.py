@@ -19,6 +19,7 @@ from twisted.python.failure import Failure
 from twisted.trial.unittest import SynchronousTestCase
 
 from otter.auth import headers
+from otter.log.bound import BoundLog
 from otter.supervisor import RequestBag
 from otter.test.utils import (
     CheckFailure,
@@ -105,6 +106,8 @@ def expected_headers(auth_token='my-auth-token'):
         'User-Agent': ['OtterScale/0.0']
     }
 
+log_matcher = matches(IsInstance(BoundLog))
+
 error_body = '{"code": 500, "message": "Internal Server Error"}'
 
 
@@ -189,6 +192,9 @@ lb_config_1 = {'loadBalancerId': 12345, 'port': 80}
 lb_config_2 = {'loadBalancerId': 54321, 'port': 81}
 lb_response_1 = {'nodes': [{'id': 'a', 'address': '192.168.1.1'}]}
 lb_response_2 = {'nodes': [{'id': 'b', 'address': '192.168.1.1'}]}
+pending_update_body = json.dumps({'message': 'PENDING_UPDATE'})
+node_deleted_msg = matches(
+    StartsWith('CLB 12345 or node a deleted due to RequestError'))
 
 
 class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
@@ -219,6 +225,16 @@ class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
                           self.lb_config, '192.168.1.1', self.undo,
                           clock=self.clock)
 
+    def expected_posts(self, n):
+        """
+        The calls :func:`add_to_clb` is expected to make to add the node, if
+        it tries ``n`` times.
+        """
+        return [mock.call('http://dfw.lbaas/loadbalancers/12345/nodes',
+                          headers=expected_headers(self.auth_token),
+                          data=mock.ANY,
+                          log=log_matcher)] * n
+
     def test_add_to_clb(self):
         """
         :func:`add_to_clb` will make a properly formed post request to
@@ -232,7 +248,7 @@ class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
             'http://dfw.lbaas/loadbalancers/12345/nodes',
             headers=expected_headers(self.auth_token),
             data=mock.ANY,
-            log=matches(IsInstance(self.log.__class__))
+            log=log_matcher
         )
 
         data = self.treq.post.mock_calls[0][2]['data']
@@ -253,19 +269,16 @@ class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         """
         :func:`add_to_clb` will retry until it succeeds.
         """
-        self.codes = [422] * 10 + [200]
-        self.treq.post.side_effect = lambda *_, **ka: succeed(mock.Mock(code=self.codes.pop(0)))
+        codes = iter([422] * 10 + [200])
+        self.treq.post.side_effect = lambda *_, **ka: succeed(
+            StubResponse(next(codes), {}))
 
         d = self._add_to_clb()
         self.clock.pump([self.retry_interval] * 11)
         result = self.successResultOf(d)
         self.assertEqual(result, self.json_content)
-        self.assertEqual(
-            self.treq.post.mock_calls,
-            [mock.call('http://dfw.lbaas/loadbalancers/12345/nodes',
-                       headers=expected_headers(self.auth_token),
-                       data=mock.ANY,
-                       log=matches(IsInstance(self.log.__class__)))] * 11)
+        self.assertEqual(self.treq.post.mock_calls,
+                         self.expected_posts(11))
         self.rand_interval.assert_called_once_with(5, 7)
 
     def test_stop_retrying_on_404(self):
@@ -273,7 +286,8 @@ class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         :func:`add_to_clb` will stop retrying if it encounters a 404.
         """
         codes = iter([422, 422, 404])
-        self.treq.post.side_effect = lambda *_, **ka: succeed(mock.Mock(code=next(codes)))
+        self.treq.post.side_effect = lambda *_, **ka: succeed(
+            StubResponse(next(codes), {}))
 
         d = self._add_to_clb()
         self.clock.advance(self.retry_interval)
@@ -288,7 +302,8 @@ class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         :func:`add_to_clb` will stop retrying if it encounters 422 with deleted CLB.
         """
         codes = iter([422, 422, 422])
-        self.treq.post.side_effect = lambda *_, **ka: succeed(mock.Mock(code=next(codes)))
+        self.treq.post.side_effect = lambda *_, **ka: succeed(
+            StubResponse(next(codes), {}))
         messages = iter(['bad', 'huh', 'The load balancer is deleted'])
         self.treq.content.side_effect = lambda *a: succeed(
             json.dumps({"message": next(messages)}))
@@ -307,18 +322,14 @@ class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         :obj:`LB_MAX_RETRIES` values unless overridden.
         """
         set_config_data(fake_config)
-        self.treq.post.side_effect = lambda *a, **kw: succeed(mock.Mock(code=422))
+        self.treq.post.side_effect = lambda *a, **kw: succeed(
+            StubResponse(422, {}))
 
         d = self._add_to_clb()
         self.clock.pump([self.retry_interval] * LB_MAX_RETRIES)
         self.failureResultOf(d, RequestError)
-        self.assertEqual(
-            self.treq.post.mock_calls,
-            [mock.call('http://dfw.lbaas/loadbalancers/12345/nodes',
-                       headers=expected_headers(self.auth_token),
-                       data=mock.ANY,
-                       log=matches(IsInstance(self.log.__class__)))] *
-            (LB_MAX_RETRIES + 1))
+        self.assertEqual(self.treq.post.mock_calls,
+                         self.expected_posts(LB_MAX_RETRIES + 1))
         self.rand_interval.assert_called_once_with(*LB_RETRY_INTERVAL_RANGE)
 
     def failed_add_to_clb(self, code=500):
@@ -326,7 +337,8 @@ class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         Helper function to ensure :func:`add_to_clb` fails by returning
         failure again and again until it times out.
         """
-        self.treq.post.side_effect = lambda *a, **kw: succeed(mock.Mock(code=code))
+        self.treq.post.side_effect = lambda *a, **kw: succeed(
+            StubResponse(code, {}))
         d = self._add_to_clb()
         self.clock.pump([self.retry_interval] * self.max_retries)
         return d
@@ -340,13 +352,8 @@ class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
 
         f = self.failureResultOf(d, RequestError)
         self.assertEqual(f.value.reason.value.code, 422)
-        self.assertEqual(
-            self.treq.post.mock_calls,
-            [mock.call('http://dfw.lbaas/loadbalancers/12345/nodes',
-                       headers=expected_headers(self.auth_token),
-                       data=mock.ANY,
-                       log=matches(IsInstance(self.log.__class__)))] *
-            (self.max_retries + 1))
+        self.assertEqual(self.treq.post.mock_calls,
+                         self.expected_posts(self.max_retries + 1))
 
     def test_retries_log_unexpected_failure(self):
         """
@@ -355,7 +362,8 @@ class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         error message.
         """
         codes = iter([500, 503, 422, 422, 401, 200])
-        self.treq.post.side_effect = lambda *_, **ka: succeed(mock.Mock(code=next(codes)))
+        self.treq.post.side_effect = lambda *_, **ka: succeed(
+            StubResponse(next(codes), {}))
         messages = iter(['bad'] * 3 + ['PENDING_UPDATE'] + ['hmm'])
         self.treq.content.side_effect = lambda *a: succeed(
             json.dumps({"message": next(messages)}))
@@ -381,7 +389,7 @@ class AddToCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         d = self._add_to_clb()
         self.successResultOf(d)
         self.undo.push.assert_called_once_with(
-            _remove_from_clb, matches(IsInstance(self.log.__class__)),
+            _remove_from_clb, log_matcher,
             'http://dfw.lbaas/', self.auth_token,
             self.lb_config["loadBalancerId"], 1)
 
@@ -623,6 +631,16 @@ class RemoveFromCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
             clock=self.clock)
         return d
 
+    def expected_deletes(self, n):
+        """
+        The calls :func:`remove_from_load_balancer` is expected to make to
+        remove the node, if it tries ``n`` times.
+        """
+        token = self.request_bag.auth_token
+        return [mock.call('http://dfw.lbaas/loadbalancers/12345/nodes/a',
+                          headers=expected_headers(token),
+                          log=log_matcher)] * n
+
     def test_remove_from_load_balancer(self):
         """
         remove_from_load_balancer makes a DELETE request against the
@@ -637,7 +655,7 @@ class RemoveFromCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         self.treq.delete.assert_called_once_with(
             'http://dfw.lbaas/loadbalancers/12345/nodes/a',
             headers=expected_headers(self.request_bag.auth_token),
-            log=matches(IsInstance(self.log.__class__)))
+            log=log_matcher)
 
     def test_remove_from_load_balancer_on_404(self):
         """
@@ -667,7 +685,7 @@ class RemoveFromCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
 
         self.assertEqual(self.successResultOf(d), None)
         self.log.msg.assert_any_call(
-            matches(StartsWith('CLB 12345 or node a deleted due to RequestError')),
+            node_deleted_msg,
             loadbalancer_id=12345, node_id="a")
 
     def test_remove_from_load_balancer_on_422_Pending_delete(self):
@@ -686,7 +704,7 @@ class RemoveFromCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
 
         self.assertEqual(self.successResultOf(d), None)
         self.log.msg.assert_any_call(
-            matches(StartsWith('CLB 12345 or node a deleted due to RequestError')),
+            node_deleted_msg,
             loadbalancer_id=12345, node_id="a")
 
     def test_remove_from_load_balancer_fails_on_422_LB_other(self):
@@ -716,21 +734,19 @@ class RemoveFromCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         remove_from_load_balancer will retry again until it succeeds and retry interval
         will be random number based on lb_retry_interval_range config value
         """
-        self.codes = [422] * 7 + [500] * 3 + [200]
-        self.treq.delete.side_effect = lambda *_, **ka: succeed(mock.Mock(code=self.codes.pop(0)))
+        codes = iter([422] * 7 + [500] * 3 + [200])
+        self.treq.delete.side_effect = lambda *_, **ka: succeed(
+            StubResponse(next(codes), {}))
         self.treq.content.side_effect = lambda *a, **ka: succeed(
-            json.dumps({'message': 'PENDING_UPDATE'}))
+            pending_update_body)
 
         d = self._remove_from_load_balancer()
 
         self.clock.pump([self.retry_interval] * 11)
         self.assertIsNone(self.successResultOf(d))
         # delete calls made?
-        self.assertEqual(
-            self.treq.delete.mock_calls,
-            [mock.call('http://dfw.lbaas/loadbalancers/12345/nodes/a',
-                       headers=expected_headers(self.request_bag.auth_token),
-                       log=matches(IsInstance(self.log.__class__)))] * 11)
+        self.assertEqual(self.treq.delete.mock_calls,
+                         self.expected_deletes(11))
         # Expected logs?
         self.assertEqual(self.log.msg.mock_calls[0],
                          mock.call('Removing from load balancer',
@@ -747,9 +763,10 @@ class RemoveFromCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         remove_from_load_balancer will retry again and again for LB_MAX_RETRIES times.
         It will fail after that
         """
-        self.treq.delete.side_effect = lambda *_, **ka: succeed(mock.Mock(code=422))
+        self.treq.delete.side_effect = lambda *_, **ka: succeed(
+            StubResponse(422, {}))
         self.treq.content.side_effect = lambda *a, **ka: succeed(
-            json.dumps({'message': 'PENDING_UPDATE'}))
+            pending_update_body)
 
         d = self._remove_from_load_balancer()
 
@@ -758,12 +775,8 @@ class RemoveFromCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         failure = self.failureResultOf(d, RequestError)
         self.assertEqual(failure.value.reason.value.code, 422)
         # delete calls made?
-        self.assertEqual(
-            self.treq.delete.mock_calls,
-            [mock.call('http://dfw.lbaas/loadbalancers/12345/nodes/a',
-                       headers=expected_headers(self.request_bag.auth_token),
-                       log=matches(IsInstance(self.log.__class__)))] *
-            (self.max_retries + 1))
+        self.assertEqual(self.treq.delete.mock_calls,
+                         self.expected_deletes(self.max_retries + 1))
         # Expected logs?
         self.assertEqual(self.log.msg.mock_calls[0],
                          mock.call('Removing from load balancer',
@@ -779,9 +792,10 @@ class RemoveFromCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         or lb_retry_interval_range is not found
         """
         set_config_data(fake_config)
-        self.treq.delete.side_effect = lambda *_, **ka: succeed(mock.Mock(code=422))
+        self.treq.delete.side_effect = lambda *_, **ka: succeed(
+            StubResponse(422, {}))
         self.treq.content.side_effect = lambda *a, **ka: succeed(
-            json.dumps({'message': 'PENDING_UPDATE'}))
+            pending_update_body)
 
         d = self._remove_from_load_balancer()
 
@@ -790,12 +804,8 @@ class RemoveFromCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         failure = self.failureResultOf(d, RequestError)
         self.assertEqual(failure.value.reason.value.code, 422)
         # delete calls made?
-        self.assertEqual(
-            self.treq.delete.mock_calls,
-            [mock.call('http://dfw.lbaas/loadbalancers/12345/nodes/a',
-                       headers=expected_headers(self.request_bag.auth_token),
-                       log=matches(IsInstance(self.log.__class__)))] *
-            (LB_MAX_RETRIES + 1))
+        self.assertEqual(self.treq.delete.mock_calls,
+                         self.expected_deletes(LB_MAX_RETRIES + 1))
         # Expected logs?
         self.assertEqual(self.log.msg.mock_calls[0],
                          mock.call('Removing from load balancer',
@@ -809,11 +819,12 @@ class RemoveFromCLBTests(LoadBalancersTestsMixin, SynchronousTestCase):
         """
         add_to_clb will log unexpeted failures while it is trying
         """
-        self.codes = [500, 503, 422, 422, 401, 200]
+        codes = iter([500, 503, 422, 422, 401, 200])
         bad_codes = [500, 503, 401]
-        self.treq.delete.side_effect = lambda *_, **ka: succeed(mock.Mock(code=self.codes.pop(0)))
+        self.treq.delete.side_effect = lambda *_, **ka: succeed(
+            StubResponse(next(codes), {}))
         self.treq.content.side_effect = lambda *a, **ka: succeed(
-            json.dumps({'message': 'PENDING_UPDATE'}))
+            pending_update_body)
 
         d = self._remove_from_load_balancer()
 
@@ -891,6 +902,9 @@ def _get_server_info(metadata=None, created=None):
     return config
 
 
+no_image_url = matches(MatchesRegex('.*\?(.+&)?image=(&.+)$'))
+
+
 def reset_semaphores(testcase):
     """
     reset global sempahores to empty in beginning of test as it is module-wise
@@ -899,6 +913,17 @@ def reset_semaphores(testcase):
     testcase.patch(launch_server_v1, "_semaphores", {})
 
 
+def create_server_treq(server_config, code, body):
+    """
+    Return a :class:`StubTreq` that answers the create server request for
+    ``server_config`` with a ``code`` response whose content is ``body``.
+    """
+    req = ('POST', 'http://url/servers', headers('my-auth-token'),
+           json.dumps({'server': server_config}), None, {'log': mock.ANY})
+    resp = StubResponse(code, {})
+    return StubTreq([(req, resp)], [(resp, body)])
+
+
 class ServerTests(RequestBagTestMixin, SynchronousTestCase):
     """
     Test server manipulation functions.
@@ -982,7 +1007,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         filtering on the image id, flavor id, and exact name in the server
         config.
         """
-        self.treq.get.return_value = succeed(mock.Mock(code=200))
+        self.treq.get.return_value = succeed(StubResponse(200, {}))
         self.treq.json_content.return_value = succeed({"servers": []})
 
         find_server('http://url/', 'my-auth-token', _get_server_info())
@@ -1000,12 +1025,12 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         The query arg for image should just be "image=", so the URL should look
         like "...?...&image=" or "...?...&image=&..."
         """
-        self.treq.get.return_value = succeed(mock.Mock(code=200))
+        self.treq.get.return_value = succeed(StubResponse(200, {}))
         self.treq.json_content.return_value = succeed({"servers": []})
 
         find_server('http://url/', 'my-auth-token', server_config)
         self.treq.get.assert_called_once_with(
-            matches(MatchesRegex('.*\?(.+&)?image=(&.+)$')),
+            no_image_url,
             headers=expected_headers(),
             log=mock.ANY)
 
@@ -1053,7 +1078,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         server_config = _get_server_info()
         server_config['name'] = r"this.is[]regex\dangerous()*"
 
-        self.treq.get.return_value = succeed(mock.Mock(code=200))
+        self.treq.get.return_value = succeed(StubResponse(200, {}))
         self.treq.json_content.return_value = succeed({"servers": []})
 
         find_server('http://url/', 'my-auth-token', server_config)
@@ -1071,7 +1096,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         """
         :func:`find_server` propagates any errors from Nova
         """
-        self.treq.get.return_value = succeed(mock.Mock(code=500))
+        self.treq.get.return_value = succeed(StubResponse(500, {}))
         self.treq.content.return_value = succeed(error_body)
 
         d = find_server('http://url/', 'my-auth-token', _get_server_info())
@@ -1083,7 +1108,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         :func:`find_server` will return None for servers if Nova returns no
         matching servers
         """
-        self.treq.get.return_value = succeed(mock.Mock(code=200))
+        self.treq.get.return_value = succeed(StubResponse(200, {}))
         self.treq.json_content.return_value = succeed({"servers": []})
 
         d = find_server('http://url/', 'my-auth-token', _get_server_info())
@@ -1094,7 +1119,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         :func:`find_server` will fail if the server Nova returned does not have
         matching metadata
         """
-        self.treq.get.return_value = succeed(mock.Mock(code=200))
+        self.treq.get.return_value = succeed(StubResponse(200, {}))
         self.treq.json_content.return_value = succeed({
             'servers': [_get_server_info(metadata={'hello': 'there'})]
         })
@@ -1107,7 +1132,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         :func:`find_server` will return a server returned from Nova if the
         metadata match.
         """
-        self.treq.get.return_value = succeed(mock.Mock(code=200))
+        self.treq.get.return_value = succeed(StubResponse(200, {}))
         self.treq.json_content.return_value = succeed(
             {'servers': [_get_server_info(metadata={'hey': 'there'})]})
 
@@ -1128,7 +1153,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
             _get_server_info(created='2014-04-04T04:04:05Z'),
         ]
 
-        self.treq.get.return_value = succeed(mock.Mock(code=200))
+        self.treq.get.return_value = succeed(StubResponse(200, {}))
         self.treq.json_content.return_value = succeed({'servers': servers})
 
         d = find_server('http://url/', 'my-auth-token', _get_server_info(),
@@ -1143,14 +1168,8 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         server endpoint and return the decoded json content.  It will not
         attempt to find a server in Nova if the create request succeeds.
         """
-        req = ('POST', 'http://url/servers',
-               headers('my-auth-token'),
-               json.dumps({'server': {'some': 'stuff'}}),
-               None,
-               {'log': mock.ANY})
-        resp = StubResponse(202, {})
-
-        _treq = StubTreq([(req, resp)], [(resp, '{"server": "created"}')])
+        _treq = create_server_treq({'some': 'stuff'}, 202,
+                                   '{"server": "created"}')
 
         d = create_server('http://url/', 'my-auth-token', {'some': 'stuff'},
                           _treq=_treq, clock=self.clock)
@@ -1209,14 +1228,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         create the server, if :func:`find_server` also failed with an API
         failure.
         """
-        req = ('POST', 'http://url/servers',
-               headers('my-auth-token'),
-               json.dumps({'server': {}}),
-               None,
-               {'log': mock.ANY})
-        resp = StubResponse(500, {})
-
-        _treq = StubTreq([(req, resp)], [(resp, 'failure')])
+        _treq = create_server_treq({}, 500, 'failure')
 
         fs.return_value = fail(APIError(401, '', {}))
 
@@ -1240,14 +1252,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         error, but a server was indeed created and found, :func:`create_server`
         returns this found server successfully.  Creation is not retried.
         """
-        req = ('POST', 'http://url/servers',
-               headers('my-auth-token'),
-               json.dumps({'server': {'some': 'stuff'}}),
-               None,
-               {'log': mock.ANY})
-        resp = StubResponse(500, {})
-
-        _treq = StubTreq([(req, resp)], [(resp, 'failure')])
+        _treq = create_server_treq({'some': 'stuff'}, 500, 'failure')
 
         fs.return_value = succeed("I'm a server!")
 
@@ -1268,14 +1273,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         error, and a created server was not found, :func:`create_server`
         returns original error when on the last retry.
         """
-        req = ('POST', 'http://url/servers',
-               headers('my-auth-token'),
-               json.dumps({'server': {}}),
-               None,
-               {'log': mock.ANY})
-        resp = StubResponse(500, {})
-
-        _treq = StubTreq([(req, resp)], [(resp, 'failure')])
+        _treq = create_server_treq({}, 500, 'failure')
 
         fs.return_value = succeed(None)
 
@@ -1302,14 +1300,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         error, and no server was found to be created, :func:`create_server`
         reties the create up to 3 times by default
         """
-        req = ('POST', 'http://url/servers',
-               headers('my-auth-token'),
-               json.dumps({'server': {}}),
-               None,
-               {'log': mock.ANY})
-        resp = StubResponse(500, {})
-
-        _treq = StubTreq([(req, resp)], [(resp, error_body)])
+        _treq = create_server_treq({}, 500, error_body)
 
         fs.side_effect = lambda *a, **kw: succeed(None)
 
@@ -1331,14 +1322,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         If attempting to create a server fails due to a Nova 400 error,
         creation is not retried.  Server existence is not attempted.
         """
-        req = ('POST', 'http://url/servers',
-               headers('my-auth-token'),
-               json.dumps({'server': {}}),
-               None,
-               {'log': mock.ANY})
-        resp = StubResponse(400, {})
-
-        _treq = StubTreq([(req, resp)], [(resp, "User error!")])
+        _treq = create_server_treq({}, 400, "User error!")
 
         d = create_server(
             'http://url/', 'my-auth-token', {}, log=self.log, _treq=_treq)
@@ -1401,10 +1385,10 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         """
         clock = Clock()
 
-        server_status = ['BUILD', 'ERROR']
+        server_status = iter(['BUILD', 'ERROR'])
 
         def _server_status(*args, **kwargs):
-            return succeed({'server': {'status': server_status.pop(0)}})
+            return succeed({'server': {'status': next(server_status)}})
 
         server_details.side_effect = _server_status
 
@@ -1470,10 +1454,10 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         wait_for_active stops looping when it encounters an error.
         """
         clock = Clock()
-        server_status = ['BUILD', 'ERROR']
+        server_status = iter(['BUILD', 'ERROR'])
 
         def _server_status(*args, **kwargs):
-            return succeed({'server': {'status': server_status.pop(0)}})
+            return succeed({'server': {'status': next(server_status)}})
 
         server_details.side_effect = _server_status
 
@@ -1502,10 +1486,10 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         wait_for_active stops looping when it encounters the active state.
         """
         clock = Clock()
-        server_status = ['BUILD', 'ACTIVE']
+        server_status = iter(['BUILD', 'ACTIVE'])
 
         def _server_status(*args, **kwargs):
-            return succeed({'server': {'status': server_status.pop(0)}})
+            return succeed({'server': {'status': next(server_status)}})
 
         server_details.side_effect = _server_status
 
@@ -1921,7 +1905,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         self.assertEqual(mock_wfa.call_count, 1)
         mock_vd.assert_called_once_with(
             # the undo stack is not re-wound, so original request bag is used
-            matches(IsInstance(self.log.__class__)), 'http://dfw.openstack/',
+            log_matcher, 'http://dfw.openstack/',
             self.request_bag, '1')
         self.log.msg.assert_called_once_with(
             '{server_id} errored, deleting and creating new server instead',
@@ -1939,7 +1923,7 @@ class ServerTests(RequestBagTestMixin, SynchronousTestCase):
         self.assertEqual(
             mock_vd.mock_calls,
             # the undo stack is not re-wound, so original request bag is used
-            [mock.call(matches(IsInstance(self.log.__class__)),
+            [mock.call(log_matcher,
                        'http://dfw.openstack/',
                        self.request_bag, '1')] * 2)
         self.assertEqual(
@@ -2141,6 +2125,8 @@ sample_otter_metadata = {
 
 sample_user_metadata = {"some_user_key": "some_user_value"}
 
+sample_metadata = merge(sample_otter_metadata, sample_user_metadata)
+
 
 class MetadataScrubbingTests(SynchronousTestCase):
     """
@@ -2154,7 +2140,7 @@ class MetadataScrubbingTests(SynchronousTestCase):
         samples = [
             ({'metadata': {}}, {'metadata': {}}),
             ({'metadata': sample_otter_metadata}, {'metadata': {}}),
-            ({'metadata': merge(sample_otter_metadata, sample_user_metadata)},
+            ({'metadata': sample_metadata},
              {'metadata': sample_user_metadata})
         ]
 
@@ -2175,9 +2161,7 @@ class MetadataScrubbingTests(SynchronousTestCase):
         treq = StubTreq2([(("GET", expected_url,
                             {"headers": expected_headers(),
                              "data": None}),
-                           (200, json.dumps({
-                               'metadata': merge(sample_otter_metadata,
-                                                 sample_user_metadata)}))),
+                           (200, json.dumps({'metadata': sample_metadata}))),
                           (("PUT", expected_url,
                             {"headers": expected_headers(),
                              "data": json.dumps({
@@ -2241,6 +2225,25 @@ class DeleteServerTests(RequestBagTestMixin, SynchronousTestCase):
                           clock=self.clock)
         return d
 
+    def _patch_delete_and_verify(self, side_effect=None):
+        """
+        Patch :func:`delete_and_verify` with a mock that has the given
+        ``side_effect``, and return the mock.
+        """
+        delete_and_verify = patch(
+            self, 'otter.worker.launch_server_v1.delete_and_verify')
+        delete_and_verify.side_effect = side_effect
+        return delete_and_verify
+
+    def expected_delete_and_verify_calls(self, n):
+        """
+        The calls :func:`verified_delete` is expected to make to
+        :func:`delete_and_verify`, if it tries ``n`` times.
+        """
+        return [mock.call(matches(IsBoundWith(server_id='serverId')),
+                          'http://url/', self.request_bag, 'serverId',
+                          self.clock)] * n
+
     def test_delete_server_no_lbs(self):
         """
         :func:`delete_server` removes the nodes specified in instance details
@@ -2543,9 +2546,8 @@ class DeleteServerTests(RequestBagTestMixin, SynchronousTestCase):
 
         It also logs deletion success.
         """
-        delete_and_verify = patch(
-            self, 'otter.worker.launch_server_v1.delete_and_verify')
-        delete_and_verify.side_effect = lambda *a, **kw: fail(Exception("bad"))
+        delete_and_verify = self._patch_delete_and_verify(
+            lambda *a, **kw: fail(Exception("bad")))
 
         d = verified_delete(self.log, 'http://url/', self.request_bag,
                             'serverId', exp_start=2, max_retries=2,
@@ -2556,16 +2558,12 @@ class DeleteServerTests(RequestBagTestMixin, SynchronousTestCase):
         delete_and_verify.side_effect = lambda *a, **kw: None
 
         self.clock.advance(2)
-        self.assertEqual(
-            delete_and_verify.mock_calls,
-            [mock.call(matches(IsBoundWith(server_id='serverId')),
-                       'http://url/',
-                       self.request_bag, 'serverId', self.clock)] * 2)
+        self.assertEqual(delete_and_verify.mock_calls,
+                         self.expected_delete_and_verify_calls(2))
         self.successResultOf(d)
 
         # the loop has stopped
-        self.clock.pump([5])
-        self.assertEqual(delete_and_verify.call_count, 2)
+        self.assertEqual(self.clock.getDelayedCalls(), [])
 
         # success logged
         self.log.msg.assert_called_with(
@@ -2577,9 +2575,7 @@ class DeleteServerTests(RequestBagTestMixin, SynchronousTestCase):
         If the deleting fails until the timeout, log a failure and do not
         keep trying to delete.
         """
-        delete_and_verify = patch(
-            self, 'otter.worker.launch_server_v1.delete_and_verify')
-        delete_and_verify.side_effect = (
+        delete_and_verify = self._patch_delete_and_verify(
             lambda *a, **kw: fail(DummyException("bad")))
 
         d = verified_delete(self.log, 'http://url/', self.request_bag,
@@ -2593,14 +2589,83 @@ class DeleteServerTests(RequestBagTestMixin, SynchronousTestCase):
 
         self.clock.advance(4)
         self.failureResultOf(d, DummyException)
-        self.assertEqual(
-            delete_and_verify.mock_calls,
-            [mock.call(matches(IsBoundWith(server_id='serverId')),
-                       'http://url/', self.request_bag, 'serverId',
-                       self.clock)] * 3)
+        self.assertEqual(delete_and_verify.mock_calls,
+                         self.expected_delete_and_verify_calls(3))
 
         # the loop has stopped
-        self.clock.pump([16, 32])
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_verified_delete_backoff_is_capped(self):
+        """
+        The interval between delete attempts doubles but never exceeds
+        ``max_interval``.
+        """
+        delete_and_verify = self._patch_delete_and_verify(
+            lambda *a, **kw: fail(DummyException("bad")))
+
+        d = verified_delete(self.log, 'http://url/', self.request_bag,
+                            'serverId', exp_start=2, max_retries=4,
+                            max_interval=4, clock=self.clock)
+        self.clock.pump([2, 4, 4])
+        self.assertNoResult(d)
+        self.assertEqual(delete_and_verify.call_count, 4)
+
+        self.clock.advance(4)
+        self.failureResultOf(d, DummyException)
+        self.assertEqual(delete_and_verify.call_count, 5)
+
+    def test_verified_delete_default_retry_window(self):
+        """
+        By default, deleting keeps being retried for about 34 minutes, even
+        though the interval between attempts is capped at 30 seconds.
+        """
+        delete_and_verify = patch(
+            self, 'otter.worker.launch_server_v1.delete_and_verify')
+        delete_and_verify.side_effect = (
+            lambda *a, **kw: fail(DummyException("bad")))
+
+        d = verified_delete(self.log, 'http://url/', self.request_bag,
+                            'serverId', clock=self.clock)
+        self.clock.pump([2, 4, 8, 16] + [30] * 67)
+        self.assertNoResult(d)
+
+        self.clock.advance(30)
+        self.failureResultOf(d, DummyException)
+        self.assertEqual(delete_and_verify.call_count, 73)
+
+    def test_verified_delete_does_not_retry_rejected_delete(self):
+        """
+        If Nova rejects the delete with a 400 or 403, do not keep trying to
+        delete.
+        """
+        delete_and_verify = self._patch_delete_and_verify()
+
+        for code in (400, 403):
+            delete_and_verify.side_effect = lambda *a, **kw: fail(
+                RequestError(Failure(APIError(code, '', {})), 'http://url/'))
+
+            d = verified_delete(self.log, 'http://url/', self.request_bag,
+                                'serverId', clock=self.clock)
+            failure = self.failureResultOf(d, RequestError)
+            self.assertEqual(failure.value.reason.value.code, code)
+
+        self.assertEqual(delete_and_verify.call_count, 2)
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_verified_delete_retries_other_request_errors(self):
+        """
+        Request errors other than a rejected delete, such as a 500 from Nova,
+        are retried.
+        """
+        delete_and_verify = self._patch_delete_and_verify(
+            lambda *a, **kw: fail(RequestError(
+                Failure(APIError(500, '', {})), 'http://url/')))
+
+        d = verified_delete(self.log, 'http://url/', self.request_bag,
+                            'serverId', exp_start=2, max_retries=2,
+                            clock=self.clock)
+        self.clock.pump([2, 4])
+        self.failureResultOf(d, RequestError)
         self.assertEqual(delete_and_verify.call_count, 3)
 
 
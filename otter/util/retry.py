@@ -203,15 +203,17 @@ def random_interval(minimum, maximum):
     return lambda f: random.uniform(minimum, maximum)
 
 
-def exponential_backoff_interval(start=2):
+def exponential_backoff_interval(start=2, maximum=None):
     """
     Returns a ``next_interval`` function for `:py:func:retry` that returns previous
     interval * 2 as new interval each time it is called
 
     :param start: number of seconds > 0 to start with
+    :param maximum: number of seconds the interval will never exceed, or
+        ``None`` for no limit
     :return: a function that accepts a :class:`Failure` and returns ``interval``
     """
-    return ExponentialBackoffInterval(start=start)
+    return ExponentialBackoffInterval(start=start, maximum=maximum)
 
 
 def retry(do_work, can_retry=None, next_interval=None, clock=None):
@@ -266,13 +268,15 @@ class TransientRetryError(Exception):
 
 # TODO: The following code should be moved to effect.retry if it proves out.
 
-@attributes(['start', Attribute('last_interval', default_value=0)])
+@attributes(['start', Attribute('maximum', default_value=None),
+             Attribute('last_interval', default_value=0)])
 class ExponentialBackoffInterval(object):
     """
     A callable that returns the previous interval * 2 (starting at
-    ``start``) every time it's called.
+    ``start``) every time it's called, never exceeding ``maximum``.
 
     :param start: number of seconds > 0 to start with
+    :param maximum: number of seconds the interval is capped at, or ``None``
     :return: a function that accepts a :class:`Failure` and returns ``interval``
     """
 
@@ -282,6 +286,8 @@ class ExponentialBackoffInterval(object):
             self.last_interval *= 2
         else:
             self.last_interval = self.start
+        if self.maximum is not None:
+            self.last_interval = min(self.last_interval, self.maximum)
         return self.last_interval
 
 
@@ -937,12 +937,27 @@ def delete_and_verify(log, server_endpoint, request_bag, server_id, clock):
     return request_bag.re_auth().addCallback(delete)
 
 
+def _can_retry_delete(failure):
+    """
+    A ``can_retry`` function for :func:`verified_delete` that gives up when
+    Nova has rejected the DELETE request outright (400 or 403), since trying
+    again will not change the answer.  Everything else, including a server
+    that is not yet in the ``deleting`` task state, is treated as transient.
+    """
+    if failure.check(RequestError):
+        reason = failure.value.reason
+        return not (reason.check(APIError) and
+                    reason.value.code in (400, 403))
+    return True
+
+
 def verified_delete(log,
                     server_endpoint,
                     request_bag,
                     server_id,
                     exp_start=2,
-                    max_retries=10,
+                    max_retries=72,
+                    max_interval=30,
                     clock=None):
     """
     Attempt to delete a server from the server endpoint, and ensure that it is
@@ -959,7 +974,11 @@ def verified_delete(log,
     :param str auth_token: Keystone Auth token.
     :param str server_id: Opaque nova server id.
     :param int exp_start: Exponential backoff interval start seconds. Default 2
-    :param int max_retries: Maximum number of retry attempts
+    :param int max_retries: Maximum number of retry attempts. The default,
+        together with the default ``max_interval``, keeps retrying for about
+        34 minutes, as ten uncapped doublings from 2 seconds used to.
+    :param int max_interval: Maximum number of seconds to wait between
+        attempts, or ``None`` for no limit. Default 30
 
     :return: Deferred that fires when the expected status has been seen.
     """
@@ -973,8 +992,9 @@ def verified_delete(log,
     d = retry(
         partial(delete_and_verify, serv_log, server_endpoint, request_bag,
                 server_id, clock),
-        can_retry=retry_times(max_retries),
-        next_interval=exponential_backoff_interval(exp_start),
+        can_retry=compose_retries(_can_retry_delete,
+                                  retry_times(max_retries)),
+        next_interval=exponential_backoff_interval(exp_start, max_interval),
         clock=clock)
 
     d.addCallback(log_with_time, clock, serv_log, clock.seconds(),